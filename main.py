@@ -14,9 +14,10 @@ A1 C2 A3 B5 D6 F7 H8
 
 import sys
 import re
+from array import array
+from functools import lru_cache
 from heapq import heappush, heappop
-from itertools import product
-from collections import defaultdict
+from itertools import chain, product, takewhile
 
 
 def dijkstra(graph: dict, src: str, dst: str) -> str:
@@ -32,91 +33,114 @@ def dijkstra(graph: dict, src: str, dst: str) -> str:
         str: Shortest path. (eg D4 E6 G7)
     """
 
-    inf = sys.maxsize   # System max size for infinity.
+    inf = float('inf')
 
-    # Initialize all nodes costs to be infinity and predecessors to be an empty
-    # list.
-    node_data = {k: {'cost': inf, 'pred': []} for k in graph}
-
-    # Cost of source is known to be zero.
-    node_data[src]['cost'] = 0
+    # Cost from src of each node reached so far, nodes not in it have infinite
+    # cost, and predecessor of each of those nodes.
+    dist = {src: 0}
+    pred = {src: None}
 
     # Nodes that have been visited.
-    visited = []
+    visited = set()
 
     # A priority queue of nodes with known costs from src.
     min_heap = [(0, src)]
 
     while min_heap:
         #  Get the node temp that currently has the shortest path from src.
-        _, temp = heappop(min_heap)
-
-        if src == dst:
-            break
+        cost, temp = heappop(min_heap)
 
         # If node temp has already been visited, continue to another node.
         if temp in visited:
             continue
 
-        visited.append(temp)
+        visited.add(temp)
 
-        # If node doesn't have neighbours, continue to another node.
-        neighbours = graph[temp]
-        if not neighbours:
-            continue
+        # The shortest path to dst is known once dst is visited.
+        if temp == dst:
+            break
 
-        # Check each temp's neighbours to update costs and predecessors if
-        # the neighbour has not been visited yet.
-        for j in neighbours:
-            if j not in visited:
-                cost = node_data[temp]['cost'] + neighbours[j]
-                if cost < node_data[j]['cost']:
-                    node_data[j]['cost'] = cost
-                    node_data[j]['pred'] = node_data[temp]['pred'] + [temp]
-                heappush(min_heap, (node_data[j]['cost'], j))
-
-    # Generate the shortest path in the format: D4 E6 G7    
-    shortest_path = node_data[dst]['pred'] + [dst]
-    shortest_path = ' '.join(shortest_path)
+        # Check each temp's neighbours to update costs and predecessors. With
+        # nonnegative weights a visited neighbour can never be improved, and
+        # stale heap entries are skipped by the visited check above.
+        for j, weight in graph[temp].items():
+            new_cost = cost + weight
+            if new_cost < dist.get(j, inf):
+                dist[j] = new_cost
+                pred[j] = temp
+                heappush(min_heap, (new_cost, j))
+
+    # Walk the predecessors back from dst and generate the shortest path in the
+    # format: D4 E6 G7
+    shortest_path = []
+    node = dst
+    while node is not None:
+        shortest_path.append(node)
+        node = pred.get(node)
+    shortest_path = ' '.join(reversed(shortest_path))
     return shortest_path
 
 
-def get_mapping() -> dict:
-    """Generates a mapping dictionary to transform (x, y) coordinates into
-    letters and numbers.
+def bfs(graph: dict, src: str, dst: str) -> str:
+    """Breadth-first search to find single-source shortest path in a graph
+    where every edge has the same weight, such as the Knight's graph.
 
-    Example: {(1, 1): 'B2'}
+    Args:
+        graph (dict): Graph containing all nodes and edges. Edge weights are
+            ignored.
+        src (str): Source node.
+        dst (str): Destination node.
 
     Returns:
-        dict: Dictionary containing the mapping.
+        str: Shortest path. (eg D4 E6 G7)
     """
 
-    # Create a list with all combinations for a 8x8 Chess board: A1-H8
-    letters = list(product('ABCDEFGH', '12345678', repeat=1))
-    letters = list(map(lambda x: ''.join(x), letters))
-
-    # Create a list with all (x, y) coordinates for a 8x8 Chess board:
-    # (0, 0) - (7, 7)
-    n = list(product('01234567', repeat=2))
-    n = list(map(lambda x: (int(x[0]), int(x[1])), n))
-
-    # Create a mapping to transform from (x, y) coordinates to alphanumerical
-    # ones: A1-H8
-    mapping = {num: letter for letter, num in zip(letters, n)}
+    # Predecessor of each discovered node, also used as the visited set.
+    parent = {src: None}
+
+    # Nodes at the current distance from src. Each level is expanded in sorted
+    # order, so a node's predecessor is the smallest node of the previous level
+    # next to it, the same tie-break as the dijkstra min-heap.
+    frontier = [src]
+
+    while frontier and dst not in parent:
+        next_frontier = []
+        for node in sorted(frontier):
+            for neighbour in graph[node]:
+                if neighbour not in parent:
+                    parent[neighbour] = node
+                    next_frontier.append(neighbour)
+        frontier = next_frontier
+
+    # Walk the predecessors back from dst and generate the shortest path in the
+    # format: D4 E6 G7
+    shortest_path = []
+    node = dst
+    while node is not None:
+        shortest_path.append(node)
+        node = parent.get(node)
+    shortest_path = ' '.join(reversed(shortest_path))
+    return shortest_path
 
-    return mapping
 
+@lru_cache(maxsize=1)
+def get_mapping() -> dict:
+    """Generates a mapping dictionary to transform (x, y) coordinates into
+    letters and numbers. The mapping is built once and cached, so it must not
+    be modified by callers.
 
-def add_edge(graph: dict, vertex_a: str, vertex_b: str) -> None:
-    """Add edges to a Graph.
+    Example: {(1, 1): 'B2'}
 
-    Args:
-        graph (dict): Graph to add edges to.
-        vertex_a (str): First vertex.
-        vertex_b (str): Second vertex.
+    Returns:
+        dict: Dictionary containing the mapping.
     """
-    graph[vertex_a].update({vertex_b: 1})
-    graph[vertex_b].update({vertex_a: 1})
+
+    # Map (x, y) coordinates for a 8x8 Chess board, (0, 0) - (7, 7), to
+    # alphanumerical ones: A1-H8
+    return {
+        (x, y): f'{letter}{y + 1}'
+        for (x, letter), y in product(enumerate('ABCDEFGH'), range(8))
+    }
 
 
 def build_knights_graph(board_size: int) -> dict:
@@ -132,15 +156,20 @@ def build_knights_graph(board_size: int) -> dict:
         get_mapping function.
     """
 
-    graph = defaultdict(dict)
+    graph = {}
     mapping = get_mapping()
-    for row in range(board_size):
-        for col in range(board_size):
+    for row, col in product(range(board_size), repeat=2):
+
+        # Add a graph edge only with permitted knight's moves. Knight's moves
+        # are symmetric, so the reverse edge is added when its own square is
+        # visited. Squares without permitted moves are left out of the graph.
+        neighbours = {
+            mapping[(to_row, to_col)]: 1
             for to_row, to_col in generate_permitted_moves_from(
-                    row, col, board_size):
-                
-                # Add a graph edge only with permitted knight's moves
-                add_edge(graph, mapping[(row, col)], mapping[(to_row, to_col)])
+                row, col, board_size)
+        }
+        if neighbours:
+            graph[mapping[(row, col)]] = neighbours
     return graph
 
 
@@ -171,6 +200,100 @@ def generate_permitted_moves_from(row: int, col: int, board_size: int):
             yield move_row, move_col
 
 
+# Squares of the 8x8 Chess board indexed as row * 8 + col, with lookups to and
+# from their alphanumerical names.
+SQUARE_TO_STR = tuple(get_mapping()[divmod(square, 8)] for square in range(64))
+STR_TO_SQUARE = {name: square for square, name in enumerate(SQUARE_TO_STR)}
+
+# Bitboard of the squares a Knight attacks from each square: bit n is set if
+# the Knight can move to square n.
+KNIGHT_ATTACKS = tuple(
+    sum(1 << (to_row * 8 + to_col)
+        for to_row, to_col in generate_permitted_moves_from(row, col, 8))
+    for row, col in product(range(8), repeat=2)
+)
+
+
+def knights_parents(src_square: int) -> array:
+    """Breadth-first search from a square of the 8x8 Chess board to every other
+    square, using integer square indexes instead of the string-keyed graph.
+
+    Args:
+        src_square (int): Starting square index. (row * 8 + col)
+
+    Returns:
+        array: Predecessor square of each square in a shortest path from
+            src_square, or -1 for src_square itself.
+    """
+
+    # Predecessor of each square, and bitboards of the squares that have been
+    # discovered and of the squares at the current distance from src_square.
+    parent = array('b', [-1] * 64)
+    visited = frontier = 1 << src_square
+
+    # Each level is expanded lowest square first, so a square's predecessor is
+    # the lowest square of the previous level attacking it. Square order is
+    # name order (A1 < A2 < ... < H8), the same tie-break as dijkstra and bfs.
+    while frontier:
+        next_frontier = 0
+        while frontier:
+            lowest = frontier & -frontier
+            square = lowest.bit_length() - 1
+            frontier ^= lowest
+
+            # Extract the undiscovered squares attacked from square one bit at
+            # a time.
+            moves = KNIGHT_ATTACKS[square] & ~visited
+            visited |= moves
+            next_frontier |= moves
+            while moves:
+                lowest = moves & -moves
+                parent[lowest.bit_length() - 1] = square
+                moves ^= lowest
+        frontier = next_frontier
+    return parent
+
+
+# There are only 64 starting squares, so the shortest path trees from all of
+# them are precomputed at import time and each query is a table lookup. The
+# table is a flat array('b'): the predecessor of dst in the tree from src is
+# at index src * 64 + dst.
+PARENT_TABLE = array('b', chain.from_iterable(
+    knights_parents(square) for square in range(64)))
+
+
+@lru_cache(maxsize=4096)
+def knights_path(src: str, dst: str) -> str:
+    """Knight's shortest path in a 8x8 Chess board, read from the precomputed
+    PARENT_TABLE. Results are cached, so repeated queries are not rebuilt.
+
+    Args:
+        src (str): Starting position. (eg D4)
+        dst (str): End position. (eg G7)
+
+    Returns:
+        str: Shortest path. (eg D4 E6 G7)
+    """
+
+    offset = STR_TO_SQUARE[src] * 64
+
+    # Walk the predecessors back from dst and generate the shortest path in the
+    # format: D4 E6 G7
+    shortest_path = []
+    square = STR_TO_SQUARE[dst]
+    while square != -1:
+        shortest_path.append(SQUARE_TO_STR[square])
+        square = PARENT_TABLE[offset + square]
+    shortest_path = ' '.join(reversed(shortest_path))
+    return shortest_path
+
+
+# Pattern of valid user input: lines of Knight's starting and end positions,
+# joined by newlines so the whole input is validated in a single match.
+_POSITIONS = r'[A-H][1-8] [A-H][1-8]'
+INPUT_PATTERN = re.compile(rf'(?:{_POSITIONS}(?:\n{_POSITIONS})*)?')
+
+
 def input_isvalid(user_input: list) -> bool:
     """Validate the user input for the Knight's starting and end positions.
 
@@ -180,56 +303,40 @@ def input_isvalid(user_input: list) -> bool:
     Returns:
         bool: User input validity.
     """
-    
-    input_pattern = r'^[A-H][1-8]\s[A-H][1-8]$'
-    for inp in user_input:
-        if not re.match(input_pattern, inp):
-            return False
-    return True
+
+    return bool(INPUT_PATTERN.fullmatch('\n'.join(user_input)))
 
 
 def main():
     """Main function containing all the steps of the script."""
     
-    # Build Knight's path graph.
-    knights_graph = build_knights_graph(8)
-
     print("Please, enter the knight's starting and ending positions"
           " in a 8x8 Chess board (eg. D4 D5) (MacOS: ^D to exit):")
-    lines = []
-
-    # Infinite loop to retrieve multiple lines of user input and to save it to 
-    # a list.
-    while True:
-        try:
-            line = input()
-            if line:
-                lines.append(line)
-
-            # If no input is given, exit program.
-            else:
-                break
-
-        # If ^D is pressed on macOS, EOFError is thrown and program exits.
-        except EOFError:
-            break
+
+    # Read lines of user input from stdin until an empty line or EOF (^D on
+    # macOS) is reached.
+    lines = list(takewhile(bool, (line.rstrip('\n') for line in sys.stdin)))
 
     # If user input is valid, read each instruction and return the shortest
     # path for each.
     if input_isvalid(lines):
-        output = []
+        write = sys.stdout.write
         for line in lines:
             start, end = line.split()
-            result = dijkstra(knights_graph, start, end)
-            output.append(result)
-        text = '\n'.join(output)
-        print(text)
+            write(knights_path(start, end))
+            write('\n')
     else:
         print('Invalid input. Please, enter start and end positions in a 8x8 '
                 'Chess board (eg. D4 D5).')
     
     print('Press <enter> to exit.')
-    input()
+    try:
+        input()
+
+    # If stdin is already exhausted (eg. piped input), there is nothing to wait
+    # for.
+    except EOFError:
+        pass
 
 
 if __name__ == '__main__':
@@ -3,8 +3,9 @@
 
 from itertools import product
 
-from main import dijkstra, build_knights_graph, generate_permitted_moves_from, \
-    input_isvalid
+from main import dijkstra, bfs, build_knights_graph, \
+    generate_permitted_moves_from, input_isvalid, knights_path, \
+    KNIGHT_ATTACKS, SQUARE_TO_STR
 
 
 def test_dijkstra():
@@ -64,6 +65,75 @@ def test_dijkstra():
         assert dijkstra(graph, p[0], p[1]) == r
 
 
+def test_dijkstra_long_path():
+    """Test if the Djikstra algorithm rebuilds long shortest paths correctly
+    from the predecessors of each node.
+    """
+
+    # A chain graph: 0 - 1 - 2 - ... - 1999
+    n = 2000
+    nodes = [str(i) for i in range(n)]
+    graph = {node: {} for node in nodes}
+    for a, b in zip(nodes, nodes[1:]):
+        graph[a][b] = 1
+        graph[b][a] = 1
+
+    assert dijkstra(graph, nodes[0], nodes[-1]) == ' '.join(nodes)
+
+
+def test_bfs():
+    """Test if the BFS algorithm returns the same shortest paths as the
+    Djikstra algorithm in the Knight's graph.
+    """
+
+    graph = build_knights_graph(8)
+
+    assert bfs(graph, 'D4', 'D4') == 'D4'
+    assert bfs(graph, 'D4', 'E6') == 'D4 E6'
+
+    # Examples documented in the main.py module docstring.
+    assert bfs(graph, 'D4', 'G7') == 'D4 E6 G7'
+    assert bfs(graph, 'D4', 'D5') == 'D4 C2 B4 D5'
+    assert bfs(graph, 'A1', 'H8') == 'A1 C2 A3 B5 D6 F7 H8'
+
+    # BFS breaks ties between shortest paths the same way as Djikstra.
+    for src, dst in product(graph, repeat=2):
+        assert bfs(graph, src, dst) == dijkstra(graph, src, dst)
+
+    # An unreachable destination is returned on its own, as in Djikstra.
+    graph = build_knights_graph(3)
+    assert bfs(graph, 'A1', 'B2') == dijkstra(graph, 'A1', 'B2') == 'B2'
+
+
+def test_knights_path():
+    """Test if the Knight's path over integer squares matches the documented
+    examples and the BFS shortest path for every pair of squares.
+    """
+
+    assert knights_path('D4', 'D4') == 'D4'
+    assert knights_path('D4', 'E6') == 'D4 E6'
+
+    # Examples documented in the main.py module docstring and the README.
+    assert knights_path('D4', 'G7') == 'D4 E6 G7'
+    assert knights_path('D4', 'D5') == 'D4 C2 B4 D5'
+    assert knights_path('A1', 'H8') == 'A1 C2 A3 B5 D6 F7 H8'
+    assert knights_path('D4', 'G8') == 'D4 C6 E7 G8'
+
+    graph = build_knights_graph(8)
+    for src, dst in product(graph, repeat=2):
+        assert knights_path(src, dst) == bfs(graph, src, dst)
+
+
+def test_knight_attacks():
+    """Test if the Knight's attack bitboards match the Knight's path graph.
+    """
+
+    graph = build_knights_graph(8)
+    for square, attacks in enumerate(KNIGHT_ATTACKS):
+        squares = {SQUARE_TO_STR[n] for n in range(64) if (attacks >> n) & 1}
+        assert squares == set(graph[SQUARE_TO_STR[square]])
+
+
 def test_build_knights_graph():
     """Test if the Knight's path graph is built correctly for a 3x3 Chess board
     for simplicity.
@@ -115,3 +185,6 @@ def test_input_isvalid():
     assert input_isvalid([output1]) == True
     assert input_isvalid([output2]) == False
     assert input_isvalid([output3]) == False
+    assert input_isvalid([output1, output1]) == True
+    assert input_isvalid([output1, output2]) == False
+    assert input_isvalid(['A1', 'H8']) == False  # Positions split over lines.